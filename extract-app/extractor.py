@@ -0,0 +1,536 @@
+import spacy
+import fitz  # PyMuPDF
+import re
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Load the models once per process, so repeated extract_info() calls (from a
+# batch driver or a server) reuse them. Only NER is used, so skip the
+# components that would otherwise run on every snippet. Callers also run
+# each model under select_pipes() with just the components they need, in
+# case something re-enables the others.
+_NLP = spacy.load("en_core_web_sm", disable=["tagger", "parser", "attribute_ruler", "lemmatizer"])
+_NER_PIPES = ["tok2vec", "ner"]
+
+# Director and executive names are PERSON entities; some of the fallbacks
+# also skip ones that read as a role or body rather than a person.
+_NAME_STOPWORDS = ("Committee", "Chair", "Director", "Officer")
+
+def _persons(doc, stopwords=()):
+    """Distinct PERSON entities in doc longer than three characters, in
+    order, skipping any that contain one of stopwords."""
+    names = []
+    for ent in doc.ents:
+        if ent.label_ == "PERSON" and len(ent.text) > 3 and ent.text not in names:
+            if not any(word in ent.text for word in stopwords):
+                names.append(ent.text)
+    return names
+
+def _pipe(nlp, enable, snippets, batch_size):
+    """Yield docs for snippets from nlp with only the enable components running.
+
+    The pipe runs in-process and lazily, so callers that stop at the first
+    good doc only pay for the batch it came from.
+    """
+    with nlp.select_pipes(enable=enable):
+        yield from nlp.pipe(snippets, batch_size=batch_size)
+
+# Patterns used by extract_info, compiled once at import rather than per document.
+_ITEM1_NAME_RE = re.compile(r'([A-Z][a-zA-Z0-9\s,&]+(?:Inc|Corp|Corporation|Ltd|PLC|Co)\.?)')
+_ZIP_RE = re.compile(r'\d{5}(?:-\d{4})?')
+_ZIP5_RE = re.compile(r'\d{5}')
+# The street-address fallback finds a zip code first and then looks for a
+# "123 Main Street" style line in a bounded window before it, rather than
+# letting one DOTALL pattern run from every number to the next zip code.
+_ADDRESS_ZIP_RE = re.compile(r'\b\d{5}(?:-\d{4})?\b')
+_STREET_RE = re.compile(r'\b\d+\s+[A-Za-z0-9\s,]{1,80}?\b(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Way|Drive|Dr|Plaza|Parkway|Pkwy|Court|Ct|Circle|Cir|Lane|Ln)\b', re.IGNORECASE)
+_STREET_WINDOW = 300
+_CITY_STATE_ZIP_RE = re.compile(r'([A-Z][a-zA-Z\s]+,\s+[A-Z][a-zA-Z\s]+\s+\d{5})')
+_REV_HIGH_RE = re.compile(r'Total\s+(?:Net\s+)?Revenues?.*?\$\s*(\d{1,3}(?:,\d{3})+)', re.IGNORECASE | re.DOTALL)
+_REV_GEN_RE = re.compile(r'(?:Net|Total)\s+Revenues?.*?\$\s*(\d{1,3}(?:,\d{3})+)', re.IGNORECASE | re.DOTALL)
+# Outside the Statements of Operations the revenue figure is looked for in a
+# bounded window after each "Total/Net Revenues" label rather than with
+# _REV_HIGH_RE/_REV_GEN_RE, whose DOTALL .*? can run to the end of the
+# document for every label with no dollar amount after it.
+_REV_HIGH_LABEL_RE = re.compile(r'Total\s+(?:Net\s+)?Revenues?', re.IGNORECASE)
+_REV_GEN_LABEL_RE = re.compile(r'(?:Net|Total)\s+Revenues?', re.IGNORECASE)
+_DOLLAR_RE = re.compile(r'\$\s*(\d{1,3}(?:,\d{3})+)')
+_REV_WINDOW = 500
+_SYMBOL_RE = re.compile(r'Trading\s+Symbol\(s\).*?([A-Z]{1,5})\b', re.DOTALL | re.IGNORECASE)
+
+# Legal entity suffixes that mark a line as a company name. _LEGAL_SUFFIX_RE
+# finds one anywhere in a line; _LEGAL_SUFFIX_END_RE matches a (stripped)
+# line ending in one, as written or upper-cased.
+_LEGAL_SUFFIXES = ["Inc", "Inc.", "Corp", "Corp.", "Corporation", "Ltd", "Ltd.", "Limited", "PLC", "P.L.C.", "LLC", "L.L.C.", "Co.", "Company"]
+_LEGAL_SUFFIX_RE = re.compile("|".join(re.escape(suffix) for suffix in _LEGAL_SUFFIXES))
+_LEGAL_SUFFIX_END_RE = re.compile("(?:%s)$" % "|".join(re.escape(variant) for suffix in _LEGAL_SUFFIXES for variant in (suffix, suffix.upper())))
+
+_EMP_RE = re.compile(r'As of.*?, we had approximately\s+(\d+(?:,\d+)*)\s+(?:full-time\s+)?(?:employees|colleagues)', re.IGNORECASE)
+_EMP_RE_FT = re.compile(r'(\d+(?:,\d+)*)\s+(?:full-time|part-time)\s+(?:employees|colleagues)', re.IGNORECASE)
+_EMP_RE_APPROX = re.compile(r'(?:approximately|more than)\s+(\d+(?:,\d+)*)\s+(?:employees|colleagues)', re.IGNORECASE)
+_SHARES_RE = re.compile(r'(\d+(?:,\d+)*)[\s\n]+shares[\s\n]+of[\s\n]+(?:the[\s\n]+)?(?:Registrant[\u2019\']s[\s\n]+)?common[\s\n]+stock[\s\n]+outstanding', re.IGNORECASE)
+_INC_RE = re.compile(r'incorporated\s+in\s+[A-Z][a-z]+\s+(?:in|on)\s+([A-Z][a-z]+\s+\d{1,2},?\s+)?(\d{4})', re.IGNORECASE)
+_ORG_RE = re.compile(r'organized\s+under\s+the\s+laws\s+of.*?\s+in\s+(\d{4})', re.IGNORECASE)
+_FORMER_RE = re.compile(r'formerly\s+known\s+as\s+([A-Z][a-zA-Z0-9\s,&]+)', re.IGNORECASE)
+
+_PHONE_RE = re.compile(r'telephone\s+number.*?:?\s*(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})', re.IGNORECASE)
+_CFN_RE = re.compile(r'Commission\s+File\s+Number:?\s*([0-9-]+)', re.IGNORECASE)
+_EIN_RE = re.compile(r'Employer\s+Identification\s+No\.:?\s*([0-9-]+)', re.IGNORECASE)
+
+# Common auditors, in order of preference.
+_KNOWN_AUDITORS = ["Ernst & Young", "PricewaterhouseCoopers", "Deloitte", "KPMG", "Grant Thornton", "BDO"]
+
+_AUDITOR_REPORT = "Report of Independent Registered Public Accounting Firm"
+_FILER_TYPES = ["Large accelerated filer", "Accelerated filer", "Non-accelerated filer", "Smaller reporting company", "Emerging growth company"]
+_BOD_RE = re.compile(r'Board of Directors')
+_BOT_RE = re.compile(r'Board of Trustees')
+
+def _street_address(head):
+    """First "<number> <street> ... <zip>" address in head, or None.
+
+    Candidates that look like a law citation (e.g. the 1934 Act) are skipped.
+    """
+    for zip_match in _ADDRESS_ZIP_RE.finditer(head):
+        street = _STREET_RE.search(head, max(0, zip_match.start() - _STREET_WINDOW), zip_match.start())
+        if not street:
+            continue
+        candidate = head[street.start():zip_match.end()].strip().replace('\n', ', ')
+        if "Act" not in candidate and "Section" not in candidate and "Commission" not in candidate:
+            return candidate
+    return None
+
+def _amount_after_label(label_re, text):
+    """First dollar amount within _REV_WINDOW characters after a label_re match, or None."""
+    for label in label_re.finditer(text):
+        amount = _DOLLAR_RE.search(text, label.end(), label.end() + _REV_WINDOW)
+        if amount:
+            return amount.group(1)
+    return None
+
+# PDFs with more pages than this are split across worker processes. PyMuPDF
+# is not thread-safe and holds the GIL, so each worker opens the file itself
+# and extracts a contiguous range of pages. Workers are forked so they don't
+# re-import this module (and reload the spaCy model); where fork isn't
+# available extraction stays sequential.
+_PARALLEL_MIN_PAGES = 8
+_MAX_PDF_WORKERS = 8
+
+# PyMuPDF's "text" defaults, pinned so the field regexes keep the page order.
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES
+
+def _page_text(page):
+    return page.get_text("text", flags=_TEXT_FLAGS, sort=False)
+
+def _extract_page_range(pdf_path, start, stop):
+    with fitz.open(pdf_path) as doc:
+        return "".join(_page_text(doc.load_page(i)) for i in range(start, stop))
+
+def extract_text_from_pdf(pdf_path):
+    try:
+        # Join the pages once instead of growing a string page by page, and
+        # close the document so MuPDF releases it straight away.
+        with fitz.open(pdf_path) as doc:
+            page_count = len(doc)
+            workers = min(_MAX_PDF_WORKERS, os.cpu_count() or 1)
+            if page_count <= _PARALLEL_MIN_PAGES or workers < 2 or "fork" not in multiprocessing.get_all_start_methods():
+                return "".join(_page_text(page) for page in doc)
+
+        step = -(-page_count // workers)
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            return "".join(executor.map(_extract_page_range, [pdf_path] * len(starts), starts, stops))
+    except Exception as e:
+        print(f"Error reading PDF: {e}")
+        return None
+
+def extract_info(text):
+    data = {
+        "company_name": None,
+        "auditor": None,
+        "address": None,
+        "line_of_business": None,
+        "directors": [],
+        "revenue": None,
+        "shares_traded": None,
+        "employees": None,
+        "parent_ownership": None,
+        "subsidiaries_ownership": None,
+        "contact_number": None,
+        "former_name": None,
+        "senior_management": [],
+        "incorporation_date": None,
+        "company_number": None,
+        "type_of_company": None,
+        "auditor_financial_report": None,
+        "individual_profile": None,
+        "listing_proof": None,
+        "company_data": None
+    }
+
+    # Lowercased once for the case-insensitive membership checks below.
+    text_lc = text.lower()
+    # The cover page fallbacks only ever look at the start of the document;
+    # slice it once and share the prefixes between them.
+    head10k = text[:10000]
+    head5k = head10k[:5000]
+    head3k = head10k[:3000]
+
+    # 1. Company Name
+    # Heuristic: Look for "Exact name of registrant as specified in its charter"
+    # And ensure it has a legal entity suffix (_LEGAL_SUFFIXES)
+    registrant_idx = text.find("Exact name of registrant as specified in its charter")
+    if registrant_idx != -1:
+        # Look at the text immediately following
+        snippet = text[registrant_idx:registrant_idx+500]
+        lines = [line.strip() for line in snippet.splitlines()]
+        for clean_line in lines[1:]:
+            if clean_line and len(clean_line) > 3 and "Commission" not in clean_line and "Exact name" not in clean_line:
+                # Check for suffix
+                if _LEGAL_SUFFIX_RE.search(clean_line):
+                    data["company_name"] = clean_line
+                    break
+                # Sometimes the name is just the name without suffix in the header, but let's be strict if requested
+                # Or maybe the suffix is on the next line?
+                # Let's try to grab it if it looks like a name (uppercase)
+                if clean_line.isupper():
+                     data["company_name"] = clean_line
+                     break
+    
+    if not data["company_name"]:
+        # Fallback: Search first page for lines containing legal suffixes
+        # Annual reports often have the company name in large text on the first page
+        first_page_text = head3k
+        lines = [line.strip() for line in first_page_text.splitlines()]
+        for clean_line in lines:
+            # Check if line ends with a legal suffix or contains it prominently
+            if _LEGAL_SUFFIX_END_RE.search(clean_line):
+                # Filter out common noise
+                if "Commission" in clean_line or "Securities" in clean_line or "Address" in clean_line or "Copyright" in clean_line:
+                    continue
+                if len(clean_line) < 100: # Company names are usually short
+                    data["company_name"] = clean_line
+                    break
+    
+    if not data["company_name"]:
+        # Fallback: Look in "Item 1. Business" for "Company Name (the 'Company')" pattern
+        # "CVS Health Corporation, together with its subsidiaries..."
+        item1_idx = text.find("Item 1. Business")
+        if item1_idx != -1:
+            snippet = text[item1_idx:item1_idx+500]
+            # Look for a sequence of capitalized words followed by "Corporation", "Inc", etc.
+            # and maybe followed by "("
+            match = _ITEM1_NAME_RE.search(snippet)
+            if match:
+                candidate = match.group(1).strip()
+                # Clean up leading newlines or noise
+                if "\n" in candidate:
+                    candidate = candidate.splitlines()[-1].strip()
+                
+                if len(candidate) > 3 and "The" not in candidate:
+                     data["company_name"] = candidate
+
+    # 2. Address
+    # Heuristic: Look for "Address of principal executive offices"
+    addr_idx = text.find("Address of principal executive offices")
+    if addr_idx != -1:
+        snippet = text[addr_idx:addr_idx+500]
+        # The address is usually on the lines following the label, and the
+        # snippet starts at the label, so skip its first line.
+        lines = [line.strip() for line in snippet.splitlines()]
+        address_lines = []
+        for line in lines[1:]:
+            # Stop if we hit another field label like "Telephone" or "Securities"
+            if "Telephone" in line or "Securities" in line or "Indicate by check mark" in line:
+                break
+            
+            # If line contains "Zip Code", try to extract the code
+            if "Zip Code" in line:
+                # Check if the code is on this line
+                zip_match = _ZIP_RE.search(line)
+                if zip_match:
+                    address_lines.append(line[:zip_match.end()].strip())
+                else:
+                    # Maybe it's just the label, and the code is next?
+                    # Or maybe the previous lines were the address and this ends it.
+                    # Let's assume this line is part of it but we need the code.
+                    pass 
+                break
+            
+            if _ZIP5_RE.search(line):
+                address_lines.append(line)
+                break
+            if line:
+                address_lines.append(line)
+        
+        if address_lines:
+            data["address"] = ", ".join(address_lines)
+    
+    if not data["address"]:
+        # Fallback regex: Look for number followed by street name
+        # Must match "123 Main St" format
+        # Added more street types and relaxed the match slightly
+        # Search in the first few pages only
+        data["address"] = _street_address(head5k)
+        if not data["address"]:
+            # Try searching for just City, State Zip if street is missing (e.g. "New York, New York 10001")
+            city_state_zip = _CITY_STATE_ZIP_RE.search(head3k)
+            if city_state_zip:
+                 data["address"] = city_state_zip.group(1).strip().replace('\n', ', ')
+
+    # 3. Auditor
+    # Look for "Report of Independent Registered Public Accounting Firm"
+    # And find the auditor name usually at the bottom of the report (signature) or in the title
+    auditor_keywords = [_AUDITOR_REPORT]
+    
+    # Common auditors to look for specifically
+    data["auditor"] = next((auditor for auditor in _KNOWN_AUDITORS if auditor.lower() in text_lc), None)
+
+    if not data["auditor"]:
+        for keyword in auditor_keywords:
+            idx = text.find(keyword)
+            if idx != -1:
+                # Look for ORG nearby (after the header)
+                with _NLP.select_pipes(enable=_NER_PIPES):
+                    auditor_doc = _NLP(text[idx:idx+2000]) # The report is usually a page long
+                for ent in auditor_doc.ents:
+                    if ent.label_ == "ORG" and "LLP" in ent.text:
+                         data["auditor"] = ent.text
+                         break
+                break
+
+    # The directors (7) and senior management (15) sections both pull names
+    # out of a short snippet. Locate those snippets here and push them
+    # through NER in a single batched pass.
+    name_snippets = {}
+
+    # Look for "Item 10. Directors"
+    # Or "Election of Directors"
+    directors_idx = text.find("Item 10. Directors")
+    if directors_idx == -1:
+        directors_idx = text.find("Election of Directors")
+    # This is still hard because it might just refer to a proxy statement.
+    # "The information required by this item is incorporated by reference..."
+    directors_by_reference = directors_idx != -1 and "incorporated by reference" in text[directors_idx:directors_idx+500].lower()
+    if directors_idx != -1 and not directors_by_reference:
+        name_snippets["directors"] = text[directors_idx:directors_idx+2000]
+
+    # "Information about our Executive Officers"
+    mgmt_idx = text.find("Information about our Executive Officers")
+    if mgmt_idx == -1:
+        mgmt_idx = text.find("Executive Officers of the Registrant")
+    if mgmt_idx != -1:
+        name_snippets["senior_management"] = text[mgmt_idx:mgmt_idx+3000]
+
+    name_docs = {}
+    if name_snippets:
+        docs = _pipe(_NLP, _NER_PIPES, name_snippets.values(), batch_size=len(name_snippets))
+        name_docs = dict(zip(name_snippets, list(docs)))
+
+    # 4. Number of Employees
+    # Look for "employees" or "colleagues" (CVS uses colleagues)
+    # "As of October 29, 2023, we had approximately 20,000 employees"
+    emp_match = _EMP_RE.search(text)
+    if emp_match:
+        data["employees"] = emp_match.group(1)
+    else:
+        # Fallback
+        # Look for "full-time employees" specifically to avoid other large numbers
+        emp_match = _EMP_RE_FT.search(text)
+        if emp_match:
+            data["employees"] = emp_match.group(1)
+        else:
+             # Try "approximately X employees"
+             emp_match = _EMP_RE_APPROX.search(text)
+             if emp_match:
+                 data["employees"] = emp_match.group(1)
+
+    # 5. Revenue
+    # Look for "Total net revenue" or similar in Consolidated Statements of Operations
+    
+    revenue_scale = ""
+    # Check for scale indicators
+    if "in millions" in text_lc:
+        revenue_scale = " million"
+    elif "in thousands" in text_lc:
+        revenue_scale = " thousand"
+    elif "in billions" in text_lc:
+        revenue_scale = " billion"
+        
+    # Regex to capture the number
+    # Prioritize "Total Revenues" or "Total Net Revenues" (_REV_HIGH_RE) over
+    # any "Net/Total Revenues" (_REV_GEN_RE)
+
+    fin_idx = text.find("Consolidated Statements of Operations")
+    if fin_idx != -1:
+        snippet = text[fin_idx:fin_idx+5000]
+        # Look for scale in this section specifically
+        snippet_lc = snippet.lower()
+        if "(in millions" in snippet_lc:
+            revenue_scale = " million"
+        elif "(in thousands" in snippet_lc:
+            revenue_scale = " thousand"
+            
+        rev_match = _REV_HIGH_RE.search(snippet)
+        if not rev_match:
+            rev_match = _REV_GEN_RE.search(snippet)
+            
+        if rev_match:
+            data["revenue"] = "$" + rev_match.group(1) + revenue_scale
+    
+    if not data["revenue"]:
+        amount = _amount_after_label(_REV_HIGH_LABEL_RE, text)
+        if not amount:
+            amount = _amount_after_label(_REV_GEN_LABEL_RE, text)
+            
+        if amount:
+            data["revenue"] = "$" + amount + revenue_scale
+
+    # 6. Shares Traded (Common Stock outstanding)
+    # "As of November 28, 2023, there were 465,006,600 shares of the Registrant's common stock outstanding"
+    shares_match = _SHARES_RE.search(text)
+    if shares_match:
+        data["shares_traded"] = shares_match.group(1)
+
+    # 7. Directors
+    # The "Item 10. Directors" / "Election of Directors" header was located
+    # alongside the senior management snippet above.
+    # Or "Board of Directors" at the end of the document
+    if directors_by_reference:
+        data["directors"] = ["Referenced in Proxy Statement"]
+    elif "directors" in name_docs:
+        # Extract names following this header
+        data["directors"] = _persons(name_docs["directors"])
+
+    if not data["directors"] or data["directors"] == ["Referenced in Proxy Statement"]:
+        # Try searching for "Board of Directors" in the last 10% of the document
+        # or just search for the header generally
+        bod_indices = [m.start() for m in _BOD_RE.finditer(text)]
+        if bod_indices:
+            # Check the last occurrence first as it's often the listing.
+            # pipe() is lazy, so breaking out early only wastes part of a batch.
+            snippets = (text[idx:idx+2000] for idx in reversed(bod_indices))
+            for snippet_doc in _pipe(_NLP, _NER_PIPES, snippets, batch_size=4):
+                # If it looks like a list (names on new lines)
+                # Filter out common non-names
+                found_directors = _persons(snippet_doc, _NAME_STOPWORDS)
+                
+                if len(found_directors) > 3: # If we found a good list
+                    data["directors"] = found_directors
+                    break
+        
+        # If still no directors, try looking for "Trustees" (common in some funds/companies)
+        if not data["directors"]:
+             trustees_indices = [m.start() for m in _BOT_RE.finditer(text)]
+             if trustees_indices:
+                snippets = (text[idx:idx+2000] for idx in reversed(trustees_indices))
+                for snippet_doc in _pipe(_NLP, _NER_PIPES, snippets, batch_size=4):
+                    found_directors = _persons(snippet_doc, ("Committee", "Chair"))
+                    if len(found_directors) > 3:
+                        data["directors"] = found_directors
+                        break
+
+    # 8. Line of Business
+    # "Item 1. Business"
+    lob_idx = text.find("Item 1. Business")
+    if lob_idx != -1:
+        data["line_of_business"] = text[lob_idx:lob_idx+500].strip() + "..."
+
+    # 9. Contact Number
+    # "Registrant’s telephone number, including area code: (xxx) xxx-xxxx"
+    phone_match = _PHONE_RE.search(head5k)
+    if phone_match:
+        data["contact_number"] = phone_match.group(1)
+
+    # 10. Company Number (Commission File Number or IRS EIN)
+    # "Commission File Number 001-38449"
+    cfn_match = _CFN_RE.search(head5k)
+    if cfn_match:
+        data["company_number"] = cfn_match.group(1)
+    else:
+        # Try IRS EIN
+        ein_match = _EIN_RE.search(head5k)
+        if ein_match:
+            data["company_number"] = "EIN: " + ein_match.group(1)
+
+    # 11. Incorporation Date
+    # "incorporated in Delaware in 1988" or "founded in"
+    inc_match = _INC_RE.search(head10k)
+    if inc_match:
+        data["incorporation_date"] = inc_match.group(0)
+    else:
+        # Try "organized under the laws of ... in [Year]"
+        org_match = _ORG_RE.search(head10k)
+        if org_match:
+            data["incorporation_date"] = org_match.group(1)
+
+    # 12. Type of Company
+    # Check for "Large accelerated filer", "Accelerated filer", etc.
+    for ftype in _FILER_TYPES:
+        if ftype in head5k:
+            # Usually there is a check mark or "X" next to it.
+            # Simple heuristic: if it's present, it's a candidate, but we need to see if it's checked.
+            # This is hard with text extraction.
+            # Let's just infer from the name suffix for now as a fallback
+            pass
+    
+    if data["company_name"]:
+        if "Inc" in data["company_name"] or "Corporation" in data["company_name"]:
+            data["type_of_company"] = "Corporation"
+        elif "LLC" in data["company_name"]:
+            data["type_of_company"] = "LLC"
+        elif "PLC" in data["company_name"]:
+            data["type_of_company"] = "Public Limited Company"
+
+    # 13. Listing Proof (Trading Symbol)
+    # Look for table with "Trading Symbol"
+    symbol_match = _SYMBOL_RE.search(head5k)
+    if symbol_match:
+        data["listing_proof"] = "Trading Symbol: " + symbol_match.group(1)
+
+    # 14. Auditor's Financial Report
+    # Extract the first paragraph of the auditor's report
+    if data["auditor"]:
+        report_idx = text.find(_AUDITOR_REPORT)
+        if report_idx != -1:
+            # Find the start of the opinion
+            opinion_idx = text.find("Opinion on the Financial Statements", report_idx)
+            if opinion_idx != -1:
+                data["auditor_financial_report"] = text[opinion_idx:opinion_idx+500].strip() + "..."
+            else:
+                data["auditor_financial_report"] = text[report_idx:report_idx+500].strip() + "..."
+
+    # 15. Senior Management
+    # The executive officers section was located alongside the directors
+    # snippet above.
+    if "senior_management" in name_docs:
+        directors = set(data["directors"])
+        data["senior_management"] = [name for name in _persons(name_docs["senior_management"]) if name not in directors]
+
+    # 16. Subsidiaries Ownership
+    # Look for "Exhibit 21"
+    if "Exhibit 21" in text:
+        data["subsidiaries_ownership"] = "Referenced in Exhibit 21"
+    
+    # 17. Parent Ownership
+    # Look for "Parent" in Security Ownership section
+    sec_own_idx = text.find("Security Ownership of Certain Beneficial Owners")
+    if sec_own_idx != -1:
+        snippet = text[sec_own_idx:sec_own_idx+2000]
+        if "Parent" in snippet:
+            data["parent_ownership"] = "Parent company mentioned in Security Ownership section"
+        else:
+            data["parent_ownership"] = "No parent company explicitly identified in Security Ownership section"
+
+    # 18. Former Name
+    # "formerly known as"
+    former_match = _FORMER_RE.search(head5k)
+    if former_match:
+        data["former_name"] = former_match.group(1).strip()
+
+    # 19. Company Data (Metadata)
+    # Just grab the first 200 chars as a summary
+    data["company_data"] = head10k[:200].strip().replace('\n', ' ')
+
+    return data
@@ -3,112 +3,303 @@ import spacy
 import fitz  # PyMuPDF
 import re
 import json
+from contextlib import closing
 
-def extract_text_from_pdf(pdf_path):
+# Load the model once per process. Only the NER entities are used, so skip
+# the components that would otherwise run on every call.
+_NLP = spacy.load("en_core_web_sm", disable=["tagger", "parser", "attribute_ruler", "lemmatizer"])
+# The ORG fallback for the name only looks at entities on the first page.
+_NER_PREFIX = 5000
+
+# Patterns used by extract_sec_info, compiled once at import rather than per
+# call (or, for the 13F class/CUSIP checks, per line). The case-insensitive
+# ones are lowercase and run against the text lowercased once by _lower();
+# match offsets index the original text, which is where values are read.
+_RE_REGISTRANT = re.compile(r"exact name of registrant.*?specified in its charter", re.DOTALL)
+_RE_ADDR = re.compile(r"address.*?principal executive\s+offices", re.DOTALL)
+_RE_JURIS = re.compile(r"state or other jurisdiction.*?incorporation or organization", re.DOTALL)
+_RE_IRS = re.compile(r'^\d{2}-\d{7}$')
+_RE_INC_COUNTRY = re.compile(r'incorporated\s+in\s+([a-z][a-z\s]+)')
+_RE_STATE_ZIP = re.compile(r'\b[A-Z]{2}\s+\d{5}')
+# Also handles "founded Amazon.com in 1994" and Month Year dates
+_RE_INC_DATE = re.compile(r'(?:incorporated|established|founded)(?:\s+[a-z\.\,]+){0,5}?\s+(?:on|in)\s+([a-z][a-z]+\s+\d{1,2},?\s+\d{4}|[a-z][a-z]+\s+\d{4}|\d{4})')
+# A 13F holding is an issuer name line followed by a class line (COM, CL A,
+# etc.) and a 9-character CUSIP line, each ignoring surrounding whitespace.
+# Only the name line is consumed, so every line is still tried as a name.
+_RE_13F = re.compile(
+    r'^[^\S\n]*(?P<name>[^\n]*?)[^\S\n]*\n'
+    r'(?=[^\S\n]*(?:COM|CL [A-Z]|PFD|WTS|UNIT|SPON|ADR|COM SER [A-Z])[^\S\n]*\n'
+    r'[^\S\n]*[A-Z0-9]{9}[^\S\n]*$)',
+    re.MULTILINE)
+_13F_STOPWORDS = frozenset(["COLUMN 1", "NAME OF ISSUER", "SOLE", "SHARED", "NONE"])
+_13F_MAX_HOLDINGS = 20
+# "FORM 4" as a whole token, so a "FORM 40-F" cover page isn't read as one.
+_RE_FORM4 = re.compile(r'\bFORM 4\b')
+
+# The registrant, address and jurisdiction labels, plus the snippet read
+# after each, have to be in the text before reading can stop early.
+_COVER_SNIPPET = 500
+# The incorporation date is searched for in the first 20,000 characters.
+_COVER_PREFIX = 20000
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+def _lower(text):
+    """Lowercase text without shifting character offsets.
+
+    A few characters (e.g. "\u0130") lowercase to two code points; if any are
+    present only ASCII letters are lowercased, so offsets found in the
+    result still index into text.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        lowered = text.translate(_ASCII_LOWER)
+    return lowered
+
+# Unsorted, as the 13F holdings pattern expects each row's lines in stream order.
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES
+
+_OWNERSHIP_HEADING = "Security Ownership of Certain Beneficial Owners"
+_OWNERSHIP_SNIPPET = 2000
+
+_REPORTING_PERSON = "Name of Reporting Person"
+_REPORTING_SNIPPET = 200
+
+def _ownership_from_snippet(snippet):
+    """Ownership note for the text following an Item 12 heading, or None if
+    that occurrence doesn't settle it."""
+    snippet_lower = snippet.lower()
+    # Check if it says "incorporated by reference"
+    if "incorporated" in snippet_lower and "reference" in snippet_lower and "proxy statement" in snippet_lower:
+        return "Incorporated by reference from Proxy Statement"
+    # Check if there is a table with "Name of Beneficial Owner"
+    if "Name of Beneficial Owner" in snippet:
+        # Try to extract rows? This is hard without table structure.
+        # But we can say we found the table.
+        return "Contains Security Ownership table (Item 12)"
+    return None
+
+def _cover_complete(text):
+    """True if every cover-page field extract_sec_info reads is already settled by text."""
+    if len(text) < _COVER_PREFIX:
+        return False
+    text_lc = _lower(text)
+    for pattern in (_RE_REGISTRANT, _RE_ADDR, _RE_JURIS):
+        match = pattern.search(text_lc)
+        if not match or match.start() + _COVER_SNIPPET > len(text):
+            return False
+    return True
+
+def _last_lines(text, n):
+    """The last n lines of text (counting a trailing empty line)."""
+    cut = len(text)
+    for _ in range(n):
+        cut = text.rfind('\n', 0, cut)
+        if cut == -1:
+            return text
+    return text[cut + 1:]
+
+def _prev_nonempty_lines(text, end, limit):
+    """Yield the non-empty lines of text[end - limit:end], stripped, last first."""
+    start = max(0, end - limit)
+    while True:
+        i = text.rfind('\n', start, end)
+        line = text[i + 1 if i != -1 else start:end].strip()
+        if line:
+            yield line
+        if i == -1:
+            return
+        end = i
+
+def _next_nonempty_lines(text, start, limit):
+    """Yield the non-empty lines of text[start:start + limit] after the first
+    one, stripped."""
+    end = min(len(text), start + limit)
+    i = text.find('\n', start, end)
+    while i != -1:
+        j = text.find('\n', i + 1, end)
+        line = text[i + 1:j if j != -1 else end].strip()
+        if line:
+            yield line
+        i = j
+
+def _filing_form(head):
+    """"13F", "4" or "10-K" from the first 1,000 characters, as extract_sec_info
+    tells them apart, or None if both 13F and Form 4 markers are present."""
+    is_13f = "FORM 13F" in head
+    is_form4 = _RE_FORM4.search(head) is not None
+    if is_13f and is_form4:
+        return None
+    return "13F" if is_13f else "4" if is_form4 else "10-K"
+
+# A PDF whose first two pages each have less text than this is taken to be
+# scanned (images only), and isn't read any further.
+_SCANNED_CHECK_PAGES = 2
+_SCANNED_MIN_CHARS = 50
+
+class ScannedPdfError(Exception):
+    """The PDF has no text layer to extract from; it needs OCR."""
+
+def iter_pdf_pages(pdf, max_pages=None):
+    """Yield (page_number, text) for each page of pdf, in order, up to
+    max_pages if given.
+
+    pdf is a path or an open fitz.Document, so a caller handling several
+    requests for one file can keep it open. A document opened here is
+    closed when the generator finishes or is closed; one passed in is left
+    open.
+    """
+    doc = pdf if isinstance(pdf, fitz.Document) else fitz.open(pdf)
     try:
-        doc = fitz.open(pdf_path)
-        full_text = ""
-        # Read first 20 pages for metadata, and maybe search specific sections later
-        # For 10-Ks, metadata is on page 1.
-        for i, page in enumerate(doc):
-            full_text += page.get_text()
-            # If we just want metadata, we don't need the whole 100 page doc, 
-            # but for "Ownership" which is Item 12, it might be deep in the doc.
-            # Let's read all for now, it's safer.
-        return full_text
+        for page in doc:
+            if max_pages is not None and page.number >= max_pages:
+                break
+            yield page.number, page.get_text("text", flags=_TEXT_FLAGS, sort=False)
+    finally:
+        if doc is not pdf:
+            doc.close()
+
+def extract_text_from_pdf(pdf, max_pages=None):
+    """Return the text of pdf (a path or open fitz.Document), or None if it
+    can't be read. Raises ScannedPdfError if its first pages have no text.
+
+    Pages are read in order, up to max_pages if given, and reading stops
+    as soon as the rest of the PDF can no longer change extract_sec_info's
+    result: once a Form 4 has its first _NER_PREFIX characters (read by the
+    name fallback) and the snippet after "Name of Reporting Person", once a
+    13F has listed _13F_MAX_HOLDINGS distinct holdings, and for other
+    filings once the cover-page fields and the Item 12 ownership check are
+    settled.
+    """
+    try:
+        with closing(iter_pdf_pages(pdf, max_pages)) as pages:
+            parts = []
+            length = 0
+            form = ""
+            # Start offsets of Item 12 headings whose snippet hasn't been checked yet.
+            pending = []
+            tail = ""
+            can_stop = True
+            holdings = set()
+            holdings_tail = ""
+            reporting_idx = -1
+            has_text = False
+            for page_number, page_text in pages:
+                if page_number < _SCANNED_CHECK_PAGES:
+                    has_text = has_text or len(page_text.strip()) >= _SCANNED_MIN_CHARS
+                    if page_number == _SCANNED_CHECK_PAGES - 1 and not has_text:
+                        raise ScannedPdfError(f"no text on the first {_SCANNED_CHECK_PAGES} pages")
+                # Carry the end of the previous page over so a heading split
+                # across a page break is still found.
+                window = tail + page_text
+                window_start = length - len(tail)
+                i = window.find(_OWNERSHIP_HEADING)
+                while i != -1:
+                    pending.append(window_start + i)
+                    i = window.find(_OWNERSHIP_HEADING, i + 1)
+                tail = window[-(len(_OWNERSHIP_HEADING) - 1):]
+                parts.append(page_text)
+                length += len(page_text)
+
+                if form == "" and length >= 1000:
+                    form = _filing_form("".join(parts)[:1000])
+                if not can_stop or not form:
+                    continue
+
+                if form == "4":
+                    # The name fallback reads the first _NER_PREFIX
+                    # characters, which can run past a short first page.
+                    if length < _NER_PREFIX:
+                        continue
+                    if reporting_idx == -1:
+                        reporting_idx = "".join(parts).find(_REPORTING_PERSON)
+                    if reporting_idx != -1 and reporting_idx + _REPORTING_SNIPPET <= length:
+                        break
+                    continue
+                if form == "13F":
+                    # Holdings are reported in filing order, so once enough
+                    # distinct ones are in, later pages can't change them.
+                    # The previous page's last lines are rescanned for
+                    # holdings split across the page break.
+                    window = holdings_tail + page_text
+                    for m in _RE_13F.finditer(window):
+                        name = m.group("name")
+                        if len(name) > 2 and name not in _13F_STOPWORDS:
+                            holdings.add(name)
+                    holdings_tail = _last_lines(window, 4)
+                    if len(holdings) >= _13F_MAX_HOLDINGS and length >= _COVER_PREFIX:
+                        break
+                    continue
+
+                if pending and pending[0] + _OWNERSHIP_SNIPPET <= length:
+                    text = "".join(parts)
+                    while pending and pending[0] + _OWNERSHIP_SNIPPET <= length:
+                        own_idx = pending.pop(0)
+                        if _ownership_from_snippet(text[own_idx:own_idx + _OWNERSHIP_SNIPPET]):
+                            if _cover_complete(text):
+                                return text
+                            can_stop = False
+                            break
+            return "".join(parts)
+    except ScannedPdfError:
+        raise
     except Exception as e:
         print(f"Error reading PDF: {e}")
         return None
 
-def extract_sec_info(text):
-    nlp = spacy.load("en_core_web_sm")
-    # Truncate for NLP processing to avoid memory issues, but keep full text for regex searches
-    doc = nlp(text[:1000000]) 
-    
-    data = {
-        "name": None,
-        "address": None,
-        "incorporation_date": None,
-        "incorporation_country": None,
-        "registered_country": None,
-        "ownership": None
-    }
+def _extract_common(text, data):
+    """Fallback every form shares: the name from the first ORG entity on the
+    first page."""
+    # Look for large ORG entity on first page. This is the only use of NLP,
+    # so it runs only when the form's own lookups found no name.
+    if data["name"]:
+        return
+    doc = _NLP(text[:_NER_PREFIX])
+    for ent in doc.ents[:20]:
+        if ent.label_ == "ORG" and "Commission" not in ent.text and "Business Address" not in ent.text and "Mailing Address" not in ent.text:
+            data["name"] = ent.text
+            break
+
+def _extract_10k(text, data):
+    """Cover-page fields and the Item 12 ownership note of a 10-K."""
+    # Lowercased once for the case-insensitive lookups; offsets match text.
+    text_lc = _lower(text)
 
     # 1. Name
     # "Exact name of registrant as specified in its charter"
-    # Use regex for case insensitivity (Registrant vs registrant) and whitespace
-    registrant_match = re.search(r"Exact name of registrant.*?specified in its charter", text, re.IGNORECASE | re.DOTALL)
+    # Search the lowercased text (Registrant vs registrant); regex for whitespace
+    registrant_match = _RE_REGISTRANT.search(text_lc)
     if registrant_match:
         registrant_idx = registrant_match.start()
         # Look backwards first
-        snippet_before = text[max(0, registrant_idx-200):registrant_idx]
-        lines_before = snippet_before.split('\n')
-        # Iterate backwards
         found_name = False
-        for line in reversed(lines_before):
-            clean_line = line.strip()
-            if clean_line and len(clean_line) > 3 and "Commission" not in clean_line:
+        for clean_line in _prev_nonempty_lines(text, registrant_idx, 200):
+            if len(clean_line) > 3 and "Commission" not in clean_line:
                 data["name"] = clean_line
                 found_name = True
                 break
         
         if not found_name:
             # Look forwards if not found backwards (fallback)
-            snippet = text[registrant_idx:registrant_idx+500]
-            lines = snippet.split('\n')
-            for line in lines[1:]:
-                clean_line = line.strip()
-                if clean_line and len(clean_line) > 3 and "Commission" not in clean_line and "Exact name" not in clean_line:
+            for clean_line in _next_nonempty_lines(text, registrant_idx, 500):
+                if len(clean_line) > 3 and "Commission" not in clean_line and "Exact name" not in clean_line:
                     data["name"] = clean_line
                     break
     
-    # Fallback for 13F (FILER section) - Check this BEFORE generic spaCy fallback
-    if not data["name"] and "FORM 13F" in text[:1000]:
-        filer_idx = text.find("FILER")
-        if filer_idx != -1:
-            snippet = text[filer_idx:filer_idx+200]
-            lines = snippet.split('\n')
-            if len(lines) > 1:
-                candidate = lines[1].strip()
-                if candidate and "CIK" not in candidate:
-                    data["name"] = candidate
-        
-        if not data["name"]:
-             # Try "Name:" under "Institutional Investment Manager"
-             name_idx = text.find("Institutional Investment Manager Filing this Report")
-             if name_idx != -1:
-                 snippet = text[name_idx:name_idx+300]
-                 lines = snippet.split('\n')
-                 for i, line in enumerate(lines):
-                     if "Name:" in line:
-                         if i + 1 < len(lines):
-                             data["name"] = lines[i+1].strip()
-                         break
-
-    if not data["name"]:
-        # Fallback: Look for large ORG entity on first page
-        for ent in doc.ents[:20]:
-            if ent.label_ == "ORG" and "Commission" not in ent.text and "Business Address" not in ent.text and "Mailing Address" not in ent.text:
-                data["name"] = ent.text
-                break
+    _extract_common(text, data)
 
     # 2. Address
     # "Address of principal executive offices"
     # Regex to handle variations like "Address and telephone number... of principal executive offices"
-    addr_match = re.search(r"Address.*?principal executive\s+offices", text, re.IGNORECASE | re.DOTALL)
+    addr_match = _RE_ADDR.search(text_lc)
     if addr_match:
         addr_idx = addr_match.start()
         
         # Strategy 1: Look backwards (Common in 10-Ks)
-        snippet_before = text[max(0, addr_idx-300):addr_idx]
-        lines_before = snippet_before.split('\n')
         address_lines_back = []
         
         # Iterate backwards, collecting lines until we hit a label or empty space gap
-        for line in reversed(lines_before):
-            clean_line = line.strip()
-            if not clean_line:
-                continue
+        for clean_line in _prev_nonempty_lines(text, addr_idx, 300):
             # Stop if we hit another label (like IRS No or State)
             if "I.R.S." in clean_line or "State or other" in clean_line or "incorporation" in clean_line or "Identification No." in clean_line:
                 break
@@ -144,39 +335,32 @@ def extract_sec_info(text):
 
     # 3. Incorporation Country (Jurisdiction)
     # "State or other jurisdiction of incorporation or organization"
-    jurisdiction_match = re.search(r"State or other jurisdiction.*?incorporation or organization", text, re.IGNORECASE | re.DOTALL)
+    jurisdiction_match = _RE_JURIS.search(text_lc)
     if jurisdiction_match:
         jurisdiction_idx = jurisdiction_match.start()
         
         # Look backwards first
-        snippet_before = text[max(0, jurisdiction_idx-200):jurisdiction_idx]
-        lines_before = snippet_before.split('\n')
-        for line in reversed(lines_before):
-            clean_line = line.strip()
+        for clean_line in _prev_nonempty_lines(text, jurisdiction_idx, 200):
             # Skip IRS number (XX-XXXXXXX) or empty parens
             # Also skip lines that are just punctuation
-            if re.match(r'^\d{2}-\d{7}$', clean_line) or clean_line.startswith('('):
+            if _RE_IRS.match(clean_line) or clean_line.startswith('('):
                 continue
-            if clean_line and len(clean_line) > 2:
+            if len(clean_line) > 2:
                 data["incorporation_country"] = clean_line
                 break
         
         if not data["incorporation_country"]:
             # Look forwards
-            snippet = text[jurisdiction_idx:jurisdiction_idx+300]
-            lines = snippet.split('\n')
-            for line in lines[1:]:
-                clean_line = line.strip()
-                if clean_line and len(clean_line) > 2:
+            for clean_line in _next_nonempty_lines(text, jurisdiction_idx, 300):
+                if len(clean_line) > 2:
                     data["incorporation_country"] = clean_line
                     break
     
     if not data["incorporation_country"]:
         # Fallback regex
-        inc_country_pattern = re.compile(r'incorporated\s+in\s+([A-Z][a-zA-Z\s]+)', re.IGNORECASE)
-        match = inc_country_pattern.search(text[:5000])
+        match = _RE_INC_COUNTRY.search(text_lc, 0, 5000)
         if match:
-            data["incorporation_country"] = match.group(1).strip()
+            data["incorporation_country"] = text[match.start(1):match.end(1)].strip()
 
     # 4. Registered Country
     # Usually same as incorporation country, or inferred from address
@@ -185,7 +369,7 @@ def extract_sec_info(text):
     elif data["address"]:
         # Try to find country in address
         # Simple check for common countries
-        if "United States" in data["address"] or re.search(r'\b[A-Z]{2}\s+\d{5}', data["address"]):
+        if "United States" in data["address"] or _RE_STATE_ZIP.search(data["address"]):
             data["registered_country"] = "United States"
         elif "United Kingdom" in data["address"] or "UK" in data["address"]:
             data["registered_country"] = "United Kingdom"
@@ -193,83 +377,107 @@ def extract_sec_info(text):
 
     # 5. Incorporation Date
     # "incorporated in [State] on [Date]" or "founded in [Year]"
-    # Normalize text for regex (remove newlines)
-    text_normalized = text[:20000].replace('\n', ' ')
-    # Updated regex to include "established" and "founded", and Month Year format
-    # Also handle "founded Amazon.com in 1994"
-    inc_date_pattern = re.compile(r'(?:incorporated|established|founded)(?:\s+[A-Za-z\.\,]+){0,5}?\s+(?:on|in)\s+([A-Z][a-z]+\s+\d{1,2},?\s+\d{4}|[A-Z][a-z]+\s+\d{4}|\d{4})', re.IGNORECASE)
-    match = inc_date_pattern.search(text_normalized)
+    # Updated regex (_RE_INC_DATE) to include "established" and "founded", and Month Year format
+    # Its \s already matches newlines, so only the date read back from text
+    # needs them normalized to spaces.
+    match = _RE_INC_DATE.search(text_lc, 0, 20000)
     if match:
-        data["incorporation_date"] = match.group(1)
+        data["incorporation_date"] = text[match.start(1):match.end(1)].replace('\n', ' ')
 
     # 6. Ownership
-    # For 10-K: "Item 12. Security Ownership of Certain Beneficial Owners"
-    # For 13F: It IS the report of holdings.
-    
-    # Check for 10-K style ownership section
-    # Find all occurrences of "Security Ownership"
-    ownership_matches = [m.start() for m in re.finditer(r"Security Ownership of Certain Beneficial Owners", text)]
-    
-    for own_idx in ownership_matches:
-        snippet = text[own_idx:own_idx+2000]
-        
-        # Check if it says "incorporated by reference"
-        if "incorporated" in snippet.lower() and "reference" in snippet.lower() and "proxy statement" in snippet.lower():
-            data["ownership"] = "Incorporated by reference from Proxy Statement"
+    # "Item 12. Security Ownership of Certain Beneficial Owners"
+    # Walk the occurrences of "Security Ownership" until one settles it
+    own_idx = text.find(_OWNERSHIP_HEADING)
+    while own_idx != -1:
+        ownership = _ownership_from_snippet(text[own_idx:own_idx+_OWNERSHIP_SNIPPET])
+        if ownership:
+            data["ownership"] = ownership
             break
-        
-        # Check if there is a table with "Name of Beneficial Owner"
-        if "Name of Beneficial Owner" in snippet:
-             # Try to extract rows? This is hard without table structure.
-             # But we can say we found the table.
-             data["ownership"] = "Contains Security Ownership table (Item 12)"
-             break
-
-    # Check for 13F style (Name of Manager)
-    if "FORM 13F" in text[:1000]:
-        # The filer is the owner/manager
-        holdings = []
-        
-        # Logic for line-by-line extraction (Name, Class, CUSIP on separate lines)
-        lines = text.split('\n')
-        for i in range(len(lines) - 2):
-            line = lines[i].strip()
-            next_line = lines[i+1].strip()
-            next_next_line = lines[i+2].strip()
-            
-            # Check if next_line is Class and next_next_line is CUSIP
-            # Class regex: COM, CL A, etc.
-            # CUSIP regex: 9 chars alphanumeric
-            
-            is_class = re.match(r'^(COM|CL [A-Z]|PFD|WTS|UNIT|SPON|ADR|COM SER [A-Z])$', next_line)
-            is_cusip = re.match(r'^[A-Z0-9]{9}$', next_next_line)
-            
-            if is_class and is_cusip:
-                # Then current line is likely the Name
-                name = line
-                if len(name) > 2 and name not in ["COLUMN 1", "NAME OF ISSUER", "SOLE", "SHARED", "NONE"]:
-                    holdings.append(name)
-
-        if holdings:
-            # Return top 20 unique holdings
-            unique_holdings = sorted(list(set(holdings)))
-            data["ownership"] = f"Holdings include: {', '.join(unique_holdings[:20])}..."
-        elif data["name"]:
-             data["ownership"] = f"Report filed by {data['name']} (Institutional Investment Manager)"
-
-    # Check for Form 4 (Statement of Changes in Beneficial Ownership)
-    if "FORM 4" in text[:1000]:
-        # Look for "Name of Reporting Person"
-        rep_person_idx = text.find("Name of Reporting Person")
-        if rep_person_idx != -1:
-             # Extract next line
-             snippet = text[rep_person_idx:rep_person_idx+200]
+        own_idx = text.find(_OWNERSHIP_HEADING, own_idx + 1)
+
+def _extract_13f(text, data):
+    """Filer name and first holdings of a Form 13F."""
+    # Name from the FILER section - Check this BEFORE generic spaCy fallback
+    filer_idx = text.find("FILER")
+    if filer_idx != -1:
+        snippet = text[filer_idx:filer_idx+200]
+        lines = snippet.split('\n')
+        if len(lines) > 1:
+            candidate = lines[1].strip()
+            if candidate and "CIK" not in candidate:
+                data["name"] = candidate
+    
+    if not data["name"]:
+         # Try "Name:" under "Institutional Investment Manager"
+         name_idx = text.find("Institutional Investment Manager Filing this Report")
+         if name_idx != -1:
+             snippet = text[name_idx:name_idx+300]
              lines = snippet.split('\n')
-             for line in lines[1:]:
-                 if line.strip():
-                     data["ownership"] = f"Reporting Person: {line.strip()}"
+             for i, line in enumerate(lines):
+                 if "Name:" in line:
+                     if i + 1 < len(lines):
+                         data["name"] = lines[i+1].strip()
                      break
 
+    _extract_common(text, data)
+
+    # The filer is the owner/manager
+    # Name, Class and CUSIP are on separate lines; a single pass of
+    # _RE_13F finds every such triple. Only the first 20 unique holdings,
+    # in filing order, are reported, so the scan stops there.
+    seen = set()
+    holdings = []
+    for m in _RE_13F.finditer(text):
+        name = m.group("name")
+        if len(name) > 2 and name not in _13F_STOPWORDS and name not in seen:
+            seen.add(name)
+            holdings.append(name)
+            if len(holdings) >= _13F_MAX_HOLDINGS:
+                break
+
+    if holdings:
+        data["ownership"] = f"Holdings include: {', '.join(holdings)}..."
+    elif data["name"]:
+         data["ownership"] = f"Report filed by {data['name']} (Institutional Investment Manager)"
+
+def _extract_form4(text, data):
+    """Name and reporting person of a Form 4."""
+    _extract_common(text, data)
+
+    # Statement of Changes in Beneficial Ownership
+    # Look for "Name of Reporting Person"
+    rep_person_idx = text.find(_REPORTING_PERSON)
+    if rep_person_idx != -1:
+         # Extract next line
+         snippet = text[rep_person_idx:rep_person_idx+_REPORTING_SNIPPET]
+         lines = snippet.split('\n')
+         for line in lines[1:]:
+             if line.strip():
+                 data["ownership"] = f"Reporting Person: {line.strip()}"
+                 break
+
+def extract_sec_info(text):
+    data = {
+        "name": None,
+        "address": None,
+        "incorporation_date": None,
+        "incorporation_country": None,
+        "registered_country": None,
+        "ownership": None
+    }
+
+    # Each form only gets the lookups that apply to it: the 10-K cover-page
+    # patterns aren't run over a 13F's holdings table, and so on. A filing
+    # whose first page carries both the 13F and Form 4 markers is read as a
+    # 10-K, like any other filing.
+    form = _filing_form(text[:1000])
+    if form == "13F":
+        _extract_13f(text, data)
+    elif form == "4":
+        _extract_form4(text, data)
+    else:
+        _extract_10k(text, data)
+
     return data
 
 if __name__ == "__main__":
@@ -278,7 +486,11 @@ if __name__ == "__main__":
         sys.exit(1)
 
     pdf_path = sys.argv[1]
-    text = extract_text_from_pdf(pdf_path)
+    try:
+        text = extract_text_from_pdf(pdf_path)
+    except ScannedPdfError as e:
+        print(f"{pdf_path} looks like a scanned PDF ({e}). Run it through the OCR engine (ocr-engine, POST /extract) first.")
+        sys.exit(1)
     
     if text:
         extracted_data = extract_sec_info(text)
@@ -1,10 +1,91 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
-from pdf2image import convert_from_bytes
+from fastapi.concurrency import run_in_threadpool
+import fitz  # PyMuPDF
+from PIL import Image
 import pytesseract
 from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+import asyncio
 import io
+import multiprocessing
+import os
+import tempfile
 
-app = FastAPI(title="OCR Engine")
+# Pages are OCRed in parallel, one per worker process, so keep Tesseract's
+# own OpenMP threading from oversubscribing the cores. This has to be set
+# before tesserocr loads OpenMP; the pool's workers re-import this module,
+# and pytesseract's tesseract processes inherit it from the environment.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    # tesserocr drives the Tesseract library in-process and keeps the language
+    # data loaded from page to page; pytesseract starts a tesseract process
+    # per page, so it is only the fallback.
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+_pool = None
+
+@asynccontextmanager
+async def lifespan(app):
+    global _pool
+    # Workers come from a forkserver rather than a fork of this process,
+    # which by now is running the event loop's and Starlette's threads.
+    _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("forkserver"))
+    try:
+        yield
+    finally:
+        _pool.shutdown()
+
+app = FastAPI(title="OCR Engine", lifespan=lifespan)
+
+# Resolution scanned pages are rendered at for OCR.
+_DPI = 150
+# Pages with more extractable text than this are born-digital; their text
+# layer is used as is instead of OCRing them.
+_NATIVE_TEXT_MIN = 500
+# The text layer is read in content-stream order, without a sort pass.
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Uploads are copied to disk in chunks of this size.
+_UPLOAD_CHUNK = 1 << 20
+
+def _read_pages(pdf_path):
+    """Read each page of the PDF at pdf_path.
+
+    A page with a text layer gives its text; any other page is rendered to
+    a grayscale pixmap for OCR.
+    """
+    pages = []
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            text = page.get_text("text", flags=_TEXT_FLAGS, sort=False)
+            if len(text.strip()) > _NATIVE_TEXT_MIN:
+                pages.append(text)
+            else:
+                pages.append(page.get_pixmap(dpi=_DPI, colorspace=fitz.csGRAY))
+    return pages
+
+# Each pool worker keeps one Tesseract instance for every page it OCRs.
+_api = None
+
+def _ocr_page(samples, width, height, n, stride):
+    """OCR one rendered page, given as a grayscale pixmap's raw samples.
+
+    Runs in a pool worker.
+    """
+    global _api
+    if tesserocr is not None:
+        if _api is None:
+            _api = tesserocr.PyTessBaseAPI()
+        _api.SetImageBytes(samples, width, height, n, stride)
+        _api.SetSourceResolution(_DPI)
+        return _api.GetUTF8Text()
+
+    image = Image.frombytes("L", (width, height), samples, "raw", "L", stride)
+    return pytesseract.image_to_string(image)
 
 @app.post("/extract")
 async def extract_text_from_pdf(file: UploadFile = File(...)):
@@ -12,22 +93,34 @@ async def extract_text_from_pdf(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
     try:
-        contents = await file.read()
-        
-        # Convert PDF to images
-        images = convert_from_bytes(contents)
-        
+        # Stream the upload to a temporary file rather than holding all of
+        # it in memory, then read the pages with PyMuPDF off the event loop
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
+            while chunk := await file.read(_UPLOAD_CHUNK):
+                tmp.write(chunk)
+            tmp.flush()
+            pages = await run_in_threadpool(_read_pages, tmp.name)
+
+        # OCR the scanned (rendered) pages across the pool
+        loop = asyncio.get_running_loop()
+        ocr_texts = iter(await asyncio.gather(*(
+            loop.run_in_executor(_pool, _ocr_page, pix.samples, pix.width, pix.height, pix.n, pix.stride)
+            for pix in pages if not isinstance(pix, str)
+        )))
+
         extracted_data = []
-        
-        for i, image in enumerate(images):
-            # Extract text from image
-            text = pytesseract.image_to_string(image)
-            
+
+        for i, page in enumerate(pages):
+            if isinstance(page, str):
+                text, source = page, "native"
+            else:
+                text, source = next(ocr_texts), "ocr"
             extracted_data.append({
                 "page_number": i + 1,
-                "text": text.strip()
+                "text": text.strip(),
+                "source": source
             })
-            
+
         return {"filename": file.filename, "pages": extracted_data}
 
     except Exception as e: